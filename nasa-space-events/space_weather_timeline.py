@@ -9,64 +9,305 @@ solar explosions and their Earth impact.
 API Documentation: https://ccmc.gsfc.nasa.gov/tools/DONKI/
 """
 
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import multiprocessing
+import os
+import sys
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
 import re
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import matplotlib.dates as mdates
-import numpy as np
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
+from functools import lru_cache
 from collections import Counter
+from itertools import chain
+from operator import attrgetter, itemgetter
+
+if TYPE_CHECKING:
+    # numpy and matplotlib are imported inside the functions that use them,
+    # so fetch-only callers don't pay for loading them
+    import numpy as np
+
+try:
+    import ciso8601
+except ImportError:  # optional speedup, see the "fast" extra
+    ciso8601 = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional incremental parser, see the "stream" extra
+    ijson = None
+
+try:
+    import requests_cache
+except ImportError:  # optional on-disk HTTP cache, see the "cache" extra
+    requests_cache = None
 
 
 # NASA API configuration
 NASA_API_KEY = "DEMO_KEY"  # Replace with your API key for higher rate limits
 BASE_URL = "https://api.nasa.gov/DONKI"
+REQUEST_TIMEOUT = (5, 30)  # (connect, read) seconds
+
+# Date ranges longer than this are split into windows fetched concurrently;
+# at most MAX_CONCURRENT_REQUESTS are in flight to respect DONKI rate limits.
+FETCH_WINDOW_DAYS = 31
+MAX_CONCURRENT_REQUESTS = 5
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+# Responses larger than this are parsed one record at a time when ijson is
+# installed, so multi-year ranges never hold the fully decoded list in memory
+STREAM_PARSE_THRESHOLD = 1024 * 1024  # bytes
+
+# Headless runs with at least this many events render the independent charts
+# in up to MAX_CHART_WORKERS processes; below it, worker start-up (importing
+# matplotlib again in each) costs more than the rendering it parallelizes
+MAX_CHART_WORKERS = 4
+PARALLEL_CHART_MIN_EVENTS = 2000
+
+# Responses are cached on disk when requests-cache is installed. Past events
+# don't change, so re-runs skip the network and stay under DEMO_KEY limits.
+# The database lives in the user cache directory (e.g. ~/.cache on Linux),
+# not the current one, and is only opened by the first fetch.
+CACHE_NAME = "donki_cache"
+CACHE_EXPIRE_AFTER = timedelta(hours=6)
+# Windows reaching today can still gain events, so they are revalidated on
+# every run; with a stored ETag/Last-Modified, DONKI answers 304 Not Modified
+# and the cached body is reused without transferring the JSON again. Windows
+# that ended more than CACHE_SETTLED_AFTER ago are final and never expire.
+CACHE_SETTLED_AFTER = timedelta(days=7)
+
+# Without a display (CI, cron, SSH) charts are rendered with the Agg backend
+# and only saved; set MPL_HEADLESS=1 or pass --headless to force this on a
+# desktop too.
+_HEADLESS = os.environ.get("MPL_HEADLESS", "0") == "1" or (
+    sys.platform.startswith("linux")
+    and not os.environ.get("DISPLAY")
+    and not os.environ.get("WAYLAND_DISPLAY")
+    and "ipykernel" not in sys.modules  # notebooks render inline
+)
+
+
+def _create_session() -> requests.Session:
+    """Create a pooled session so all DONKI calls share TCP/TLS connections."""
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            CACHE_NAME,
+            backend="sqlite",
+            use_cache_dir=True,
+            expire_after=CACHE_EXPIRE_AFTER,
+            cache_control=True,
+            allowable_codes=(200,),
+            stale_if_error=True,  # serve cached data if NASA returns a 5xx
+        )
+    else:
+        session = requests.Session()
+    retries = Retry(total=3, backoff_factor=0.5,
+                    status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=MAX_CONCURRENT_REQUESTS,
+                          max_retries=retries)
+    session.mount("https://", adapter)
+    return session
+
+
+_SESSION: Optional[requests.Session] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _get_session() -> requests.Session:
+    """Return the shared session, creating it on first use.
+
+    Deferred so importing the module (including in each chart worker) never
+    opens the cache database.
+    """
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            _SESSION = _create_session()
+        return _SESSION
+
+
+def _parse_iso_time(value: str) -> datetime:
+    """Parse a DONKI ISO-8601 timestamp."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+if ciso8601 is not None:
+    def _parse_time(value: str) -> datetime:
+        """Parse a DONKI ISO-8601 timestamp with the ciso8601 C parser."""
+        try:
+            # Handles the trailing "Z" DONKI uses without a string copy
+            return ciso8601.parse_datetime(value)
+        except ValueError:
+            # ciso8601 is stricter than fromisoformat; retry the lenient path
+            return _parse_iso_time(value)
+else:
+    _parse_time = _parse_iso_time
+
+# Both accept the raw UTF-8 response bytes, skipping a decode to str
+_loads = orjson.loads if orjson is not None else json.loads
+
+_kp_index = itemgetter("kpIndex")
+_start_time = attrgetter("start_time")
 
 
-@dataclass
+class EventType(IntEnum):
+    """DONKI event type; the value is also the event's row on the timeline."""
+    GST = 1
+    CME = 2
+    FLR = 3
+
+
+EVENT_COLORS = {
+    EventType.FLR: "#FF6B6B",
+    EventType.CME: "#4ECDC4",
+    EventType.GST: "#9B59B6",
+}
+
+EVENT_LABELS = {
+    EventType.FLR: "Solar Flares (FLR)",
+    EventType.CME: "Coronal Mass Ejections (CME)",
+    EventType.GST: "Geomagnetic Storms (GST)",
+}
+
+# Above this many events the timeline's per-event intensity labels overlap
+# into an unreadable band, so they are skipped along with their draw cost
+MAX_TIMELINE_LABELS = 50
+
+
+@dataclass(slots=True, frozen=True)
 class SpaceEvent:
     """Represents a space weather event."""
     event_id: str
-    event_type: str  # 'FLR', 'CME', or 'GST'
+    event_type: EventType
     start_time: datetime
     end_time: Optional[datetime]
     intensity: str  # Flare class, CME type, or Kp index
-    linked_events: list
+    linked_events: tuple[str, ...]
 
 
-def fetch_solar_flares(start_date: str, end_date: str) -> list[SpaceEvent]:
-    """Fetch Solar Flare (FLR) data from DONKI API."""
-    url = f"{BASE_URL}/FLR"
+def _utc_datetime64(times: list[Optional[datetime]]) -> np.ndarray:
+    """Convert UTC event times to a naive datetime64[us] array (None -> NaT)."""
+    import numpy as np
+    return np.array([t.replace(tzinfo=None) if t else None for t in times],
+                    dtype='datetime64[us]')
+
+
+@dataclass(slots=True, frozen=True)
+class EventColumns:
+    """Column-wise view of an event list for the vectorized chart code."""
+    start_times: np.ndarray  # datetime64[us], UTC
+    intensities: np.ndarray  # object
+
+    @classmethod
+    def from_events(cls, events: list[SpaceEvent]) -> "EventColumns":
+        import numpy as np
+        return cls(
+            start_times=_utc_datetime64([e.start_time for e in events]),
+            intensities=np.array([e.intensity for e in events], dtype=object),
+        )
+
+    def __len__(self) -> int:
+        return len(self.start_times)
+
+
+def _fetch_json(endpoint: str, start_date: str, end_date: str,
+                session: Optional[requests.Session] = None) -> Iterable[dict]:
+    """Fetch the raw JSON event records for a DONKI endpoint."""
+    if session is None:
+        session = _get_session()
+    url = f"{BASE_URL}/{endpoint}"
     params = {
         "startDate": start_date,
         "endDate": end_date,
         "api_key": NASA_API_KEY
     }
 
-    response = requests.get(url, params=params)
+    # Per-request expiry only exists on cached sessions; a plain Session
+    # passed by the caller would reject the keyword
+    options = {}
+    if requests_cache is not None and isinstance(session, requests_cache.CachedSession):
+        now = datetime.now()
+        if end_date >= now.strftime("%Y-%m-%d"):
+            options["expire_after"] = requests_cache.EXPIRE_IMMEDIATELY
+        elif end_date < (now - CACHE_SETTLED_AFTER).strftime("%Y-%m-%d"):
+            options["expire_after"] = requests_cache.NEVER_EXPIRE
+
+    with _REQUEST_SLOTS:
+        response = session.get(url, params=params, timeout=REQUEST_TIMEOUT, **options)
     response.raise_for_status()
-    data = response.json()
+    content = response.content
+    if ijson is not None and len(content) > STREAM_PARSE_THRESHOLD:
+        return ijson.items(content, "item", use_float=True)
+    return _loads(content)
+
+
+def _date_windows(start_date: str, end_date: str, days: int = FETCH_WINDOW_DAYS):
+    """Split an inclusive YYYY-MM-DD range into windows of at most `days` days."""
+    start = datetime.strptime(start_date, "%Y-%m-%d")
+    end = datetime.strptime(end_date, "%Y-%m-%d")
+    while start <= end:
+        window_end = min(start + timedelta(days=days - 1), end)
+        yield start.strftime("%Y-%m-%d"), window_end.strftime("%Y-%m-%d")
+        start = window_end + timedelta(days=1)
+
+
+def _fetch_records(endpoint: str, id_key: str, start_date: str, end_date: str,
+                   session: Optional[requests.Session] = None) -> Iterator[dict]:
+    """Fetch DONKI records, splitting long date ranges into concurrent requests."""
+    windows = list(_date_windows(start_date, end_date))
+    if len(windows) <= 1:
+        yield from _fetch_json(endpoint, start_date, end_date, session)
+        return
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_REQUESTS) as executor:
+        chunks = executor.map(lambda window: _fetch_json(endpoint, *window, session), windows)
+        # Events spanning a window boundary can be reported twice; keep the
+        # first and remember only its id, not the whole record
+        seen = set()
+        for record in chain.from_iterable(chunks):
+            record_id = record[id_key]
+            if record_id not in seen:
+                seen.add(record_id)
+                yield record
+
+
+def fetch_solar_flares(start_date: str, end_date: str,
+                       session: Optional[requests.Session] = None) -> list[SpaceEvent]:
+    """Fetch Solar Flare (FLR) data from DONKI API."""
+    data = _fetch_records("FLR", "flrID", start_date, end_date, session)
 
     events = []
     for flare in data:
-        start = datetime.fromisoformat(flare["beginTime"].replace("Z", "+00:00"))
+        start = _parse_time(flare["beginTime"])
         end = None
         if flare.get("endTime"):
-            end = datetime.fromisoformat(flare["endTime"].replace("Z", "+00:00"))
+            end = _parse_time(flare["endTime"])
 
         # Get flare class (e.g., M1.5, X2.0)
         intensity = flare.get("classType", "Unknown")
 
-        linked = []
+        linked = ()
         if flare.get("linkedEvents"):
-            linked = [e.get("activityID", "") for e in flare["linkedEvents"]]
+            linked = tuple(e.get("activityID", "") for e in flare["linkedEvents"])
 
         events.append(SpaceEvent(
             event_id=flare["flrID"],
-            event_type="FLR",
+            event_type=EventType.FLR,
             start_time=start,
             end_time=end,
             intensity=intensity,
@@ -76,22 +317,14 @@ def fetch_solar_flares(start_date: str, end_date: str) -> list[SpaceEvent]:
     return events
 
 
-def fetch_cme(start_date: str, end_date: str) -> list[SpaceEvent]:
+def fetch_cme(start_date: str, end_date: str,
+              session: Optional[requests.Session] = None) -> list[SpaceEvent]:
     """Fetch Coronal Mass Ejection (CME) data from DONKI API."""
-    url = f"{BASE_URL}/CME"
-    params = {
-        "startDate": start_date,
-        "endDate": end_date,
-        "api_key": NASA_API_KEY
-    }
-
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    data = response.json()
+    data = _fetch_records("CME", "activityID", start_date, end_date, session)
 
     events = []
     for cme in data:
-        start = datetime.fromisoformat(cme["startTime"].replace("Z", "+00:00"))
+        start = _parse_time(cme["startTime"])
 
         # CMEs don't have a simple end time, use analysis data if available
         end = None
@@ -104,13 +337,13 @@ def fetch_cme(start_date: str, end_date: str) -> list[SpaceEvent]:
             cme_type = analysis.get("type", "Unknown")
             intensity = f"{cme_type} ({speed} km/s)"
 
-        linked = []
+        linked = ()
         if cme.get("linkedEvents"):
-            linked = [e.get("activityID", "") for e in cme["linkedEvents"]]
+            linked = tuple(e.get("activityID", "") for e in cme["linkedEvents"])
 
         events.append(SpaceEvent(
             event_id=cme["activityID"],
-            event_type="CME",
+            event_type=EventType.CME,
             start_time=start,
             end_time=end,
             intensity=intensity,
@@ -120,36 +353,27 @@ def fetch_cme(start_date: str, end_date: str) -> list[SpaceEvent]:
     return events
 
 
-def fetch_geomagnetic_storms(start_date: str, end_date: str) -> list[SpaceEvent]:
+def fetch_geomagnetic_storms(start_date: str, end_date: str,
+                             session: Optional[requests.Session] = None) -> list[SpaceEvent]:
     """Fetch Geomagnetic Storm (GST) data from DONKI API."""
-    url = f"{BASE_URL}/GST"
-    params = {
-        "startDate": start_date,
-        "endDate": end_date,
-        "api_key": NASA_API_KEY
-    }
-
-    response = requests.get(url, params=params)
-    response.raise_for_status()
-    data = response.json()
+    data = _fetch_records("GST", "gstID", start_date, end_date, session)
 
     events = []
     for storm in data:
-        start = datetime.fromisoformat(storm["startTime"].replace("Z", "+00:00"))
+        start = _parse_time(storm["startTime"])
 
         # Get Kp index (measure of geomagnetic activity)
-        intensity = "Unknown"
-        if storm.get("allKpIndex"):
-            max_kp = max(storm["allKpIndex"], key=lambda x: x.get("kpIndex", 0))
-            intensity = f"Kp {max_kp.get('kpIndex', 'N/A')}"
+        peak = max((kp for kp in storm.get("allKpIndex") or () if "kpIndex" in kp),
+                   key=_kp_index, default=None)
+        intensity = f"Kp {_kp_index(peak)}" if peak is not None else "Unknown"
 
-        linked = []
+        linked = ()
         if storm.get("linkedEvents"):
-            linked = [e.get("activityID", "") for e in storm["linkedEvents"]]
+            linked = tuple(e.get("activityID", "") for e in storm["linkedEvents"])
 
         events.append(SpaceEvent(
             event_id=storm["gstID"],
-            event_type="GST",
+            event_type=EventType.GST,
             start_time=start,
             end_time=None,
             intensity=intensity,
@@ -159,112 +383,242 @@ def fetch_geomagnetic_storms(start_date: str, end_date: str) -> list[SpaceEvent]
     return events
 
 
+def fetch_all(start_date: str, end_date: str,
+              session: Optional[requests.Session] = None
+              ) -> tuple[list[SpaceEvent], list[SpaceEvent], list[SpaceEvent]]:
+    """
+    Fetch flares, CMEs and geomagnetic storms for a date range.
+
+    The three endpoints are independent, so the requests are issued
+    concurrently and the call waits on the slowest one only. Returns
+    (flares, cmes, storms).
+    """
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        flr_future = executor.submit(fetch_solar_flares, start_date, end_date, session)
+        cme_future = executor.submit(fetch_cme, start_date, end_date, session)
+        gst_future = executor.submit(fetch_geomagnetic_storms, start_date, end_date, session)
+        return flr_future.result(), cme_future.result(), gst_future.result()
+
+
+def build_event_index(*event_lists: list[SpaceEvent]) -> dict[str, SpaceEvent]:
+    """Map event IDs to events across any number of event lists."""
+    return {e.event_id: e for e in chain(*event_lists)}
+
+
+def find_linked_pairs(sources: Iterable[SpaceEvent], target_type: EventType,
+                      event_index: dict[str, SpaceEvent]) -> list[tuple[SpaceEvent, SpaceEvent]]:
+    """Pair each source event with every linked event of `target_type`."""
+    pairs = []
+    for source in sources:
+        for linked_id in source.linked_events:
+            linked = event_index.get(linked_id)
+            if linked is not None and linked.event_type == target_type:
+                pairs.append((source, linked))
+    return pairs
+
+
+def find_event_chains(flr_cme_pairs: list[tuple[SpaceEvent, SpaceEvent]],
+                      event_index: dict[str, SpaceEvent]
+                      ) -> list[tuple[SpaceEvent, SpaceEvent, SpaceEvent]]:
+    """Extend FLR -> CME pairs into full FLR -> CME -> GST chains."""
+    chains = []
+    for flare, cme in flr_cme_pairs:
+        for _, gst in find_linked_pairs((cme,), EventType.GST, event_index):
+            chains.append((flare, cme, gst))
+    return chains
+
+
+@dataclass(slots=True)
+class EventSet:
+    """
+    The fetched events plus the ID lookup and linked pairs shared by every
+    chart, computed once.
+    """
+    flares: list[SpaceEvent]
+    cmes: list[SpaceEvent]
+    storms: list[SpaceEvent]
+    by_id: dict[str, SpaceEvent] = field(init=False)
+    flr_cme_pairs: list[tuple[SpaceEvent, SpaceEvent]] = field(init=False)
+    cme_gst_pairs: list[tuple[SpaceEvent, SpaceEvent]] = field(init=False)
+    chains: list[tuple[SpaceEvent, SpaceEvent, SpaceEvent]] = field(init=False)
+
+    def __post_init__(self):
+        self.by_id = build_event_index(self.flares, self.cmes, self.storms)
+        self.flr_cme_pairs = find_linked_pairs(self.flares, EventType.CME, self.by_id)
+        self.cme_gst_pairs = find_linked_pairs(self.cmes, EventType.GST, self.by_id)
+        self.chains = find_event_chains(self.flr_cme_pairs, self.by_id)
+
+
+def _configure_matplotlib():
+    """Tune global rendering settings for the script's own charts.
+
+    Called from main() and the chart workers rather than at import, so
+    modules importing the chart functions keep their own rcParams.
+    """
+    import matplotlib
+    matplotlib.rcParams.update({
+        # Coarser simplification merges near-collinear vertices of long paths
+        "path.simplify": True,
+        "path.simplify_threshold": 1.0,
+        # Agg renders very long paths in chunks instead of one huge rasterization
+        "agg.path.chunksize": 10000,
+    })
+
+
+def _subplots(nrows: int = 1, ncols: int = 1, **fig_kw):
+    """Create a figure and its axes grid, like plt.subplots().
+
+    When headless the figure is built directly on an Agg canvas, bypassing
+    pyplot's state machine and figure registry.
+    """
+    if not _HEADLESS:
+        import matplotlib.pyplot as plt
+        return plt.subplots(nrows, ncols, **fig_kw)
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    fig = Figure(**fig_kw)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots(nrows, ncols)
+
+
+def _show():
+    """Show a finished chart; headless figures are never registered with pyplot."""
+    if not _HEADLESS:
+        import matplotlib.pyplot as plt
+        plt.show()
+
+
 def create_timeline_chart(flares: list[SpaceEvent],
                           cmes: list[SpaceEvent],
                           storms: list[SpaceEvent],
                           title: str = "Space Weather Timeline",
-                          save_path: str = None):
+                          save_path: str = None,
+                          event_index: Optional[dict[str, SpaceEvent]] = None):
     """
     Create a timeline/Gantt chart showing solar flares, CMEs, and geomagnetic storms.
     Visualizes the propagation delay from solar events to Earth impact.
+
+    `event_index` maps event IDs to events; it is built from the three lists
+    when not supplied.
     """
-    fig, ax = plt.subplots(figsize=(16, 10))
+    import numpy as np
+    import matplotlib.patches as mpatches
+    import matplotlib.dates as mdates
+    import matplotlib.transforms as mtransforms
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
 
-    # Define colors and y-positions for each event type
-    event_config = {
-        "FLR": {"color": "#FF6B6B", "y": 3, "label": "Solar Flares (FLR)"},
-        "CME": {"color": "#4ECDC4", "y": 2, "label": "Coronal Mass Ejections (CME)"},
-        "GST": {"color": "#9B59B6", "y": 1, "label": "Geomagnetic Storms (GST)"}
-    }
+    # Constrained layout solves the layout once while drawing, replacing a
+    # tight_layout() pass plus a second bbox_inches='tight' pass on save
+    fig, ax = _subplots(figsize=(16, 10), layout='constrained')
 
     # Plot events
-    all_dates = []
+    all_x = []
+    all_y = []
+    marker_colors = []
+    event_x = {}  # event_id -> start time as a Matplotlib date number
     event_annotations = []
-
-    def plot_events(events: list[SpaceEvent], config: dict):
-        for event in events:
-            all_dates.append(event.start_time)
-
-            # Plot event marker
-            ax.scatter(event.start_time, config["y"],
-                      s=150, c=config["color"],
-                      zorder=5, alpha=0.8, edgecolors='white', linewidth=1)
-
-            # Add intensity label
-            event_annotations.append({
-                'x': event.start_time,
-                'y': config["y"],
-                'text': event.intensity,
-                'color': config["color"]
-            })
-
-            # If event has duration, draw a line
-            if event.end_time:
-                ax.hlines(config["y"], event.start_time, event.end_time,
-                         colors=config["color"], linewidth=4, alpha=0.6)
+    duration_lines = []
+    duration_colors = []
+
+    # Event times are converted to Matplotlib date numbers once, up front, and
+    # every artist below receives plain floats. Markers and duration lines for
+    # all event types are collected here and drawn as one artist each.
+    ax.xaxis_date()
+
+    def plot_events(events: list[SpaceEvent], event_type: EventType):
+        if not events:
+            return
+        y, color = event_type, EVENT_COLORS[event_type]
+        xs = mdates.date2num([event.start_time for event in events])
+        all_x.append(xs)
+        all_y.append(np.full(len(events), y))
+        marker_colors.extend([color] * len(events))
+        event_x.update(zip((event.event_id for event in events), xs))
+
+        # Add intensity labels
+        event_annotations.extend({
+            'x': x,
+            'y': y,
+            'text': event.intensity,
+            'color': color
+        } for x, event in zip(xs, events))
+
+        # Events with a duration get a line from start to end
+        timed = [event for event in events if event.end_time]
+        if timed:
+            starts = mdates.date2num([event.start_time for event in timed])
+            ends = mdates.date2num([event.end_time for event in timed])
+            duration_lines.extend(((x0, y), (x1, y)) for x0, x1 in zip(starts, ends))
+            duration_colors.extend([color] * len(timed))
 
     # Plot all event types
-    plot_events(flares, event_config["FLR"])
-    plot_events(cmes, event_config["CME"])
-    plot_events(storms, event_config["GST"])
+    plot_events(flares, EventType.FLR)
+    plot_events(cmes, EventType.CME)
+    plot_events(storms, EventType.GST)
+
+    if all_x:
+        # Plot event markers
+        ax.scatter(np.concatenate(all_x), np.concatenate(all_y),
+                   s=150, c=marker_colors, rasterized=True,
+                   zorder=5, alpha=0.8, edgecolors='white', linewidth=1)
+    if duration_lines:
+        ax.add_collection(LineCollection(duration_lines, colors=duration_colors,
+                                         linewidths=4, alpha=0.6))
 
     # Draw connections between linked events (solar event -> Earth impact)
     connection_lines = []
-    all_events = {e.event_id: e for e in flares + cmes + storms}
+    all_events = event_index if event_index is not None else build_event_index(flares, cmes, storms)
+
+    # Most events have no links; skip them before entering the inner loop
+    source_events = [e for e in chain(flares, cmes) if e.linked_events]
 
-    for event in flares + cmes:
+    for event in source_events:
         for linked_id in event.linked_events:
             if linked_id in all_events:
                 linked_event = all_events[linked_id]
                 # Only connect if it's a GST (Earth impact) or CME following a flare
-                if linked_event.event_type in ["GST", "CME"]:
-                    source_y = event_config[event.event_type]["y"]
-                    target_y = event_config[linked_event.event_type]["y"]
+                if linked_event.event_type in (EventType.GST, EventType.CME):
+                    source_y = event.event_type
+                    target_y = linked_event.event_type
 
                     # Calculate travel time
                     travel_time = linked_event.start_time - event.start_time
                     hours = travel_time.total_seconds() / 3600
 
-                    # Draw connecting arrow
-                    ax.annotate(
-                        '',
-                        xy=(linked_event.start_time, target_y),
-                        xytext=(event.start_time, source_y),
-                        arrowprops=dict(
-                            arrowstyle='->',
-                            color='gray',
-                            alpha=0.4,
-                            connectionstyle='arc3,rad=0.2',
-                            linewidth=1.5
-                        )
-                    )
+                    # Queue the connecting line; all are drawn as one collection
+                    source_x = event_x[event.event_id]
+                    target_x = event_x.get(linked_id)
+                    if target_x is None:  # linked event outside the plotted lists
+                        target_x = mdates.date2num(linked_event.start_time)
+                    connection_lines.append(((source_x, source_y), (target_x, target_y)))
 
                     # Add travel time label
-                    mid_time = event.start_time + travel_time / 2
-                    mid_y = (source_y + target_y) / 2
-                    ax.annotate(
-                        f'{hours:.1f}h',
-                        xy=(mid_time, mid_y),
-                        fontsize=7,
-                        color='gray',
-                        alpha=0.8,
-                        ha='center'
-                    )
-
-    # Add event intensity annotations (offset to avoid overlap)
-    for i, ann in enumerate(event_annotations):
-        offset = 0.15 if i % 2 == 0 else -0.25
-        ax.annotate(
-            ann['text'],
-            xy=(ann['x'], ann['y']),
-            xytext=(0, 20 if offset > 0 else -20),
-            textcoords='offset points',
-            fontsize=7,
-            rotation=45,
-            ha='left',
-            color=ann['color'],
-            alpha=0.9
-        )
+                    ax.text((source_x + target_x) / 2, (source_y + target_y) / 2,
+                            f'{hours:.1f}h',
+                            fontsize=7,
+                            color='gray',
+                            alpha=0.8,
+                            ha='center')
+
+    if connection_lines:
+        ax.add_collection(LineCollection(connection_lines, colors='gray',
+                                         alpha=0.4, linewidths=1.5))
+
+    # Add event intensity annotations (offset to avoid overlap). Labels
+    # alternate above and below their marker; the 20pt shifts are baked into
+    # two shared transforms instead of resolving offset points per annotation.
+    if len(event_annotations) < MAX_TIMELINE_LABELS:
+        above = mtransforms.offset_copy(ax.transData, fig=fig, y=20, units='points')
+        below = mtransforms.offset_copy(ax.transData, fig=fig, y=-20, units='points')
+        for i, ann in enumerate(event_annotations):
+            ax.text(ann['x'], ann['y'], ann['text'],
+                    transform=above if i % 2 == 0 else below,
+                    fontsize=7,
+                    rotation=45,
+                    ha='left',
+                    color=ann['color'],
+                    alpha=0.9)
 
     # Configure axes
     ax.set_yticks([1, 2, 3])
@@ -274,22 +628,21 @@ def create_timeline_chart(flares: list[SpaceEvent],
     ax.set_ylim(0.5, 3.7)
 
     # Format x-axis dates
-    if all_dates:
-        ax.set_xlim(min(all_dates) - timedelta(days=1),
-                   max(all_dates) + timedelta(days=1))
+    if all_x:
+        # Date numbers are in days, so +/- 1 pads the range by a day
+        all_x = np.concatenate(all_x)
+        ax.set_xlim(all_x.min() - 1, all_x.max() + 1)
 
-    ax.xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    ax.xaxis.set_major_locator(mdates.DayLocator(interval=2))
-    plt.xticks(rotation=45, ha='right')
+    _concise_dates(ax)
 
     # Add legend
     legend_elements = [
-        mpatches.Patch(color=config["color"], label=config["label"], alpha=0.8)
-        for config in event_config.values()
+        mpatches.Patch(color=EVENT_COLORS[t], label=EVENT_LABELS[t], alpha=0.8)
+        for t in (EventType.FLR, EventType.CME, EventType.GST)
     ]
     legend_elements.append(
-        plt.Line2D([0], [0], color='gray', alpha=0.4, linewidth=1.5,
-                   label='Event Propagation (with travel time)')
+        Line2D([0], [0], color='gray', alpha=0.4, linewidth=1.5,
+               label='Event Propagation (with travel time)')
     )
     ax.legend(handles=legend_elements, loc='upper right', fontsize=9)
 
@@ -298,78 +651,149 @@ def create_timeline_chart(flares: list[SpaceEvent],
     ax.set_xlabel('Date (UTC)', fontsize=11)
     ax.set_title(title, fontsize=14, fontweight='bold', pad=20)
 
-    # Add explanation text
-    fig.text(0.02, 0.02,
+    # Add explanation text below the area managed by the layout engine
+    fig.get_layout_engine().set(rect=(0, 0.05, 1, 0.95))
+    fig.text(0.02, 0.01,
              'Solar flares occur on the Sun\'s surface. CMEs are ejections of plasma from the corona.\n'
              'When CMEs reach Earth (1-4 days later), they can cause geomagnetic storms.',
              fontsize=8, style='italic', alpha=0.7)
 
-    plt.tight_layout()
-
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        # Light zlib compression: a larger PNG, but the window appears sooner
+        fig.savefig(save_path, dpi=150, pil_kwargs={"compress_level": 1})
         print(f"Chart saved to: {save_path}")
 
-    plt.show()
+    _show()
 
     return fig, ax
 
 
+# Intensity patterns are compiled once rather than looked up in the re cache
+# for every event
+_FLARE_RE = re.compile(r'([ABCMX])(\d+\.?\d*)')
+_SPEED_RE = re.compile(r'\((\d+\.?\d*)\s*km/s\)')
+_KP_RE = re.compile(r'Kp\s*(\d+\.?\d*)')
+_CME_TYPE_RE = re.compile(r'([A-Z]+)')
+# One match per line, with empty groups for lines that aren't a flare class
+_FLARE_LINE_RE = re.compile(r'^(?:([ABCMX])(\d+\.?\d*))?.*$', re.MULTILINE)
+
+# Numeric scale for flare classes (A=1, B=2, C=3, M=4, X=5)
+_CLASS_VAL = {'A': 1, 'B': 2, 'C': 3, 'M': 4, 'X': 5}
+
+# The same intensity strings are parsed by several charts, and many events
+# share a class or Kp value, so the parsers below are memoized
+_PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_flare_class(intensity: str) -> tuple[str, float]:
     """Parse flare class into letter and numeric value."""
-    match = re.match(r'([ABCMX])(\d+\.?\d*)', intensity)
+    match = _FLARE_RE.match(intensity)
     if match:
         letter = match.group(1)
         number = float(match.group(2))
-        # Convert to numeric scale (A=1, B=2, C=3, M=4, X=5) * intensity
-        class_values = {'A': 1, 'B': 2, 'C': 3, 'M': 4, 'X': 5}
-        return letter, class_values.get(letter, 0) * 10 + number
+        # Convert to numeric scale: class * 10 + intensity
+        return letter, _CLASS_VAL.get(letter, 0) * 10 + number
     return 'Unknown', 0
 
 
+def parse_flare_classes(intensities: Iterable[str]) -> list[tuple[str, str]]:
+    """
+    Parse many flare classes in a single regex sweep.
+
+    Returns one (letter, number) string pair per intensity, in order;
+    ('', '') marks intensities that parse_flare_class would call Unknown.
+    """
+    intensities = list(intensities)
+    if not intensities:
+        return []
+    # A newline inside an intensity would start an extra line and shift every
+    # later match onto the wrong event; only the start of each one matters
+    text = '\n'.join(intensity.replace('\n', ' ') for intensity in intensities)
+    matches = _FLARE_LINE_RE.findall(text)
+    assert len(matches) == len(intensities)
+    return matches
+
+
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_cme_speed(intensity: str) -> float:
     """Extract CME speed from intensity string."""
-    match = re.search(r'\((\d+\.?\d*)\s*km/s\)', intensity)
+    match = _SPEED_RE.search(intensity)
     if match:
         return float(match.group(1))
     return 0
 
 
+@lru_cache(maxsize=_PARSE_CACHE_SIZE)
 def parse_kp_index(intensity: str) -> float:
     """Extract Kp index from intensity string."""
-    match = re.search(r'Kp\s*(\d+\.?\d*)', intensity)
+    match = _KP_RE.search(intensity)
     if match:
         return float(match.group(1))
     return 0
 
 
+def _daily_counts(times: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Count events per UTC day; returns (days, counts) sorted by day."""
+    import numpy as np
+    return np.unique(times.astype('datetime64[D]'), return_counts=True)
+
+
+def _counts_on(all_days: np.ndarray, days: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """Spread per-day counts onto a sorted superset of days, zero elsewhere."""
+    import numpy as np
+    spread = np.zeros(len(all_days), dtype=counts.dtype)
+    spread[np.searchsorted(all_days, days)] = counts
+    return spread
+
+
+def _concise_dates(ax) -> None:
+    """Auto-placed date ticks on the x-axis, labelled compactly without rotation."""
+    import matplotlib.dates as mdates
+    locator = mdates.AutoDateLocator()
+    ax.xaxis.set_major_locator(locator)
+    ax.xaxis.set_major_formatter(mdates.ConciseDateFormatter(locator))
+
+
+def _hist_bars(ax, values, bins, **style) -> tuple[np.ndarray, np.ndarray]:
+    """Bin `values` with np.histogram and draw them with one ax.bar call."""
+    import numpy as np
+    counts, edges = np.histogram(values, bins=bins)
+    ax.bar(edges[:-1], counts, width=np.diff(edges), align='edge', **style)
+    return counts, edges
+
+
 def create_flare_chart(flares: list[SpaceEvent], save_path: str = None):
     """Create individual chart for Solar Flares."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    import numpy as np
+    import matplotlib.dates as mdates
+
+    fig, axes = _subplots(2, 2, figsize=(14, 10))
     fig.suptitle('Solar Flare (FLR) Analysis', fontsize=14, fontweight='bold')
 
-    color = '#FF6B6B'
+    color = EVENT_COLORS[EventType.FLR]
 
-    # Parse flare data
-    classes = []
-    intensities = []
-    times = []
-    for flare in flares:
-        letter, value = parse_flare_class(flare.intensity)
-        if letter != 'Unknown':
-            classes.append(letter)
-            intensities.append(value)
-            times.append(flare.start_time)
+    # Parse flare data, dropping flares without a recognised class
+    columns = EventColumns.from_events(flares)
+    matches = parse_flare_classes(columns.intensities)
+    known = np.fromiter((letter != '' for letter, _ in matches), dtype=bool, count=len(matches))
+    classes = [letter for letter, _ in matches if letter]
+    intensities = np.fromiter((_CLASS_VAL[letter] * 10 + float(number)
+                               for letter, number in matches if letter),
+                              dtype=np.float64, count=len(classes))
+    times = columns.start_times[known]
 
     # 1. Timeline of flares with intensity
     ax1 = axes[0, 0]
-    if times and intensities:
-        scatter = ax1.scatter(times, intensities, c=color, s=80, alpha=0.7, edgecolors='white')
+    if len(times):
+        # Plain date numbers skip Matplotlib's per-artist unit conversion
+        ax1.xaxis_date()
+        scatter = ax1.scatter(mdates.date2num(times), intensities, c=color, s=80, alpha=0.7, edgecolors='white',
+                              rasterized=True)
         ax1.set_ylabel('Intensity (class × 10 + value)')
         ax1.set_xlabel('Date')
         ax1.set_title('Solar Flare Timeline by Intensity')
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-        ax1.tick_params(axis='x', rotation=45)
+        _concise_dates(ax1)
         ax1.grid(True, alpha=0.3)
 
         # Add class labels on right y-axis
@@ -399,74 +823,77 @@ def create_flare_chart(flares: list[SpaceEvent], save_path: str = None):
 
     # 3. Daily event count
     ax3 = axes[1, 0]
-    if times:
-        dates = [t.date() for t in times]
-        date_counts = Counter(dates)
-        sorted_dates = sorted(date_counts.keys())
-        counts = [date_counts[d] for d in sorted_dates]
+    if len(times):
+        sorted_dates, counts = _daily_counts(times)
         ax3.bar(sorted_dates, counts, color=color, alpha=0.8, edgecolor='white')
         ax3.set_xlabel('Date')
         ax3.set_ylabel('Number of Flares')
         ax3.set_title('Daily Solar Flare Count')
-        ax3.tick_params(axis='x', rotation=45)
+        _concise_dates(ax3)
         ax3.grid(True, axis='y', alpha=0.3)
 
     # 4. Hourly distribution
     ax4 = axes[1, 1]
-    if times:
-        hours = [t.hour for t in times]
-        ax4.hist(hours, bins=24, range=(0, 24), color=color, alpha=0.8, edgecolor='white')
+    if len(times):
+        hours = times.astype('datetime64[h]').astype(np.int64) % 24
+        ax4.bar(np.arange(24), np.bincount(hours, minlength=24), width=1, align='edge',
+                color=color, alpha=0.8, edgecolor='white')
         ax4.set_xlabel('Hour (UTC)')
         ax4.set_ylabel('Count')
         ax4.set_title('Hourly Distribution of Solar Flares')
         ax4.set_xticks(range(0, 24, 3))
         ax4.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"Solar Flare chart saved to: {save_path}")
 
-    plt.show()
+    _show()
     return fig
 
 
 def create_cme_chart(cmes: list[SpaceEvent], save_path: str = None):
     """Create individual chart for Coronal Mass Ejections."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    import numpy as np
+    import matplotlib.dates as mdates
+
+    fig, axes = _subplots(2, 2, figsize=(14, 10))
     fig.suptitle('Coronal Mass Ejection (CME) Analysis', fontsize=14, fontweight='bold')
 
-    color = '#4ECDC4'
+    color = EVENT_COLORS[EventType.CME]
 
     # Parse CME data
-    speeds = []
+    columns = EventColumns.from_events(cmes)
+    times = columns.start_times
+    speeds = np.fromiter((parse_cme_speed(i) for i in columns.intensities),
+                         dtype=np.float64, count=len(columns))
     types = []
-    times = []
-    for cme in cmes:
-        speed = parse_cme_speed(cme.intensity)
-        times.append(cme.start_time)
-        speeds.append(speed)
+    for intensity in columns.intensities:
         # Extract type (S, C, O, etc.)
-        type_match = re.match(r'([A-Z]+)', cme.intensity)
+        type_match = _CME_TYPE_RE.match(intensity)
         if type_match:
             types.append(type_match.group(1))
         else:
             types.append('Unknown')
 
+    # CMEs without an analysed speed are left out of the speed panels
+    has_speed = speeds > 0
+    valid_speeds = speeds[has_speed]
+
     # 1. Timeline with speed
     ax1 = axes[0, 0]
-    if times and speeds:
-        valid_idx = [i for i, s in enumerate(speeds) if s > 0]
-        valid_times = [times[i] for i in valid_idx]
-        valid_speeds = [speeds[i] for i in valid_idx]
+    if len(times):
+        valid_times = times[has_speed]
 
-        scatter = ax1.scatter(valid_times, valid_speeds, c=color, s=60, alpha=0.7, edgecolors='white')
+        ax1.xaxis_date()
+        scatter = ax1.scatter(mdates.date2num(valid_times), valid_speeds, c=color, s=60, alpha=0.7, edgecolors='white',
+                              rasterized=True)
         ax1.set_ylabel('Speed (km/s)')
         ax1.set_xlabel('Date')
         ax1.set_title('CME Timeline by Speed')
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-        ax1.tick_params(axis='x', rotation=45)
+        _concise_dates(ax1)
         ax1.grid(True, alpha=0.3)
 
         # Add reference lines for CME categories
@@ -476,14 +903,14 @@ def create_cme_chart(cmes: list[SpaceEvent], save_path: str = None):
 
     # 2. Speed distribution histogram
     ax2 = axes[0, 1]
-    valid_speeds = [s for s in speeds if s > 0]
-    if valid_speeds:
-        ax2.hist(valid_speeds, bins=20, color=color, alpha=0.8, edgecolor='white')
+    if len(valid_speeds):
+        _hist_bars(ax2, valid_speeds, bins=20, color=color, alpha=0.8, edgecolor='white')
         ax2.set_xlabel('Speed (km/s)')
         ax2.set_ylabel('Count')
         ax2.set_title('CME Speed Distribution')
-        ax2.axvline(x=np.median(valid_speeds), color='red', linestyle='--',
-                   label=f'Median: {np.median(valid_speeds):.0f} km/s')
+        median_speed = np.median(valid_speeds)
+        ax2.axvline(x=median_speed, color='red', linestyle='--',
+                   label=f'Median: {median_speed:.0f} km/s')
         ax2.legend()
         ax2.grid(True, axis='y', alpha=0.3)
 
@@ -505,53 +932,51 @@ def create_cme_chart(cmes: list[SpaceEvent], save_path: str = None):
 
     # 4. Daily CME count
     ax4 = axes[1, 1]
-    if times:
-        dates = [t.date() for t in times]
-        date_counts = Counter(dates)
-        sorted_dates = sorted(date_counts.keys())
-        counts = [date_counts[d] for d in sorted_dates]
+    if len(times):
+        sorted_dates, counts = _daily_counts(times)
         ax4.bar(sorted_dates, counts, color=color, alpha=0.8, edgecolor='white')
         ax4.set_xlabel('Date')
         ax4.set_ylabel('Number of CMEs')
         ax4.set_title('Daily CME Count')
-        ax4.tick_params(axis='x', rotation=45)
+        _concise_dates(ax4)
         ax4.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"CME chart saved to: {save_path}")
 
-    plt.show()
+    _show()
     return fig
 
 
 def create_gst_chart(storms: list[SpaceEvent], save_path: str = None):
     """Create individual chart for Geomagnetic Storms."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+    import numpy as np
+    import matplotlib.dates as mdates
+
+    fig, axes = _subplots(2, 2, figsize=(14, 10))
     fig.suptitle('Geomagnetic Storm (GST) Analysis', fontsize=14, fontweight='bold')
 
-    color = '#9B59B6'
+    color = EVENT_COLORS[EventType.GST]
 
     # Parse GST data
-    kp_indices = []
-    times = []
-    for storm in storms:
-        kp = parse_kp_index(storm.intensity)
-        kp_indices.append(kp)
-        times.append(storm.start_time)
+    columns = EventColumns.from_events(storms)
+    times = columns.start_times
+    kp_indices = [parse_kp_index(intensity) for intensity in columns.intensities]
 
     # 1. Timeline with Kp index
     ax1 = axes[0, 0]
-    if times and kp_indices:
-        ax1.scatter(times, kp_indices, c=color, s=150, alpha=0.8, edgecolors='white', zorder=5)
-        ax1.stem(times, kp_indices, linefmt='-', markerfmt=' ', basefmt=' ')
+    if len(times) and kp_indices:
+        xs = mdates.date2num(times)  # converted once for both artists
+        ax1.xaxis_date()
+        ax1.scatter(xs, kp_indices, c=color, s=150, alpha=0.8, edgecolors='white', zorder=5)
+        ax1.stem(xs, kp_indices, linefmt='-', markerfmt=' ', basefmt=' ')
         ax1.set_ylabel('Kp Index')
         ax1.set_xlabel('Date')
         ax1.set_title('Geomagnetic Storm Timeline')
-        ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-        ax1.tick_params(axis='x', rotation=45)
+        _concise_dates(ax1)
         ax1.set_ylim(0, 9)
         ax1.grid(True, alpha=0.3)
 
@@ -566,7 +991,7 @@ def create_gst_chart(storms: list[SpaceEvent], save_path: str = None):
     ax2 = axes[0, 1]
     if kp_indices:
         bins = np.arange(4.5, 9.5, 0.5)
-        ax2.hist(kp_indices, bins=bins, color=color, alpha=0.8, edgecolor='white')
+        _hist_bars(ax2, kp_indices, bins=bins, color=color, alpha=0.8, edgecolor='white')
         ax2.set_xlabel('Kp Index')
         ax2.set_ylabel('Count')
         ax2.set_title('Kp Index Distribution')
@@ -621,8 +1046,8 @@ def create_gst_chart(storms: list[SpaceEvent], save_path: str = None):
           • Average: {np.mean(kp_indices):.2f}
 
         Date Range:
-          • First: {min(times).strftime('%Y-%m-%d %H:%M')}
-          • Last: {max(times).strftime('%Y-%m-%d %H:%M')}
+          • First: {times.min().astype(object).strftime('%Y-%m-%d %H:%M')}
+          • Last: {times.max().astype(object).strftime('%Y-%m-%d %H:%M')}
 
         Note: Kp index measures global
         geomagnetic activity (0-9 scale).
@@ -636,76 +1061,126 @@ def create_gst_chart(storms: list[SpaceEvent], save_path: str = None):
         ax4.text(0.5, 0.5, 'No geomagnetic storms\nin selected period',
                 transform=ax4.transAxes, ha='center', va='center', fontsize=14)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"Geomagnetic Storm chart saved to: {save_path}")
 
-    plt.show()
+    _show()
     return fig
 
 
-def create_pairwise_flr_cme(flares: list[SpaceEvent], cmes: list[SpaceEvent], save_path: str = None):
-    """Create pairwise comparison chart for Solar Flares and CMEs."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.suptitle('Solar Flares vs Coronal Mass Ejections', fontsize=14, fontweight='bold')
+def _trend_line(x, y) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """
+    Least-squares line through (x, y) as its two endpoints over the x range,
+    or None when x has no spread to fit against.
+    """
+    import numpy as np
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    dx = x - x.mean()
+    spread = dx @ dx
+    if spread == 0:
+        return None
+    slope = (dx @ (y - y.mean())) / spread
+    ends = np.array([x.min(), x.max()])
+    return ends, y.mean() + slope * (ends - x.mean())
+
+
+def _link_hours(links: list[tuple[SpaceEvent, ...]]) -> np.ndarray:
+    """Hours from the first to the last event of each link (a pair or a chain)."""
+    import numpy as np
+    starts = _utc_datetime64([link[0].start_time for link in links])
+    ends = _utc_datetime64([link[-1].start_time for link in links])
+    return (ends - starts) / np.timedelta64(1, 'h')
+
+
+def _link_segments(links: list[tuple[SpaceEvent, ...]], source_y: float,
+                   target_y: float) -> np.ndarray:
+    """
+    Line segments from the first to the last event of each link (a pair or a
+    chain), as Matplotlib date numbers, ready for a LineCollection.
+    """
+    import numpy as np
+    import matplotlib.dates as mdates
+    segments = np.empty((len(links), 2, 2))
+    segments[:, 0, 0] = mdates.date2num([link[0].start_time for link in links])
+    segments[:, 1, 0] = mdates.date2num([link[-1].start_time for link in links])
+    segments[:, 0, 1] = source_y
+    segments[:, 1, 1] = target_y
+    return segments
+
+
+def create_pairwise_flr_cme(flares: list[SpaceEvent], cmes: list[SpaceEvent], save_path: str = None,
+                            event_index: Optional[dict[str, SpaceEvent]] = None,
+                            linked_pairs: Optional[list[tuple[SpaceEvent, SpaceEvent]]] = None):
+    """
+    Create pairwise comparison chart for Solar Flares and CMEs.
+
+    `linked_pairs` are the (flare, cme) pairs, e.g. EventSet.flr_cme_pairs.
+    When not supplied they are found through `event_index`, which maps event
+    IDs to events and is in turn built from the given lists if missing.
+    """
+    import numpy as np
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
 
-    flr_color = '#FF6B6B'
-    cme_color = '#4ECDC4'
+    fig, axes = _subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('Solar Flares vs Coronal Mass Ejections', fontsize=14, fontweight='bold')
 
-    # Build lookup for linked events
-    all_events = {e.event_id: e for e in flares + cmes}
+    flr_color = EVENT_COLORS[EventType.FLR]
+    cme_color = EVENT_COLORS[EventType.CME]
 
     # Find linked FLR-CME pairs
-    linked_pairs = []
-    for flare in flares:
-        for linked_id in flare.linked_events:
-            if linked_id in all_events and all_events[linked_id].event_type == 'CME':
-                cme = all_events[linked_id]
-                linked_pairs.append((flare, cme))
+    if linked_pairs is None:
+        all_events = event_index if event_index is not None else build_event_index(flares, cmes)
+        linked_pairs = find_linked_pairs(flares, EventType.CME, all_events)
 
     # 1. Dual timeline
     ax1 = axes[0, 0]
     flr_times = [f.start_time for f in flares]
     cme_times = [c.start_time for c in cmes]
 
-    ax1.scatter(flr_times, [1]*len(flr_times), c=flr_color, s=60, alpha=0.7, label='Solar Flares', edgecolors='white')
-    ax1.scatter(cme_times, [0]*len(cme_times), c=cme_color, s=60, alpha=0.7, label='CMEs', edgecolors='white')
+    ax1.xaxis_date()
+    ax1.plot(mdates.date2num(flr_times), np.ones(len(flr_times)), 'o', color=flr_color, markersize=8, alpha=0.7,
+             markeredgecolor='white', linestyle='None', label='Solar Flares')
+    ax1.plot(mdates.date2num(cme_times), np.zeros(len(cme_times)), 'o', color=cme_color, markersize=8, alpha=0.7,
+             markeredgecolor='white', linestyle='None', label='CMEs')
 
-    # Draw connections for linked events
-    for flare, cme in linked_pairs:
-        ax1.annotate('', xy=(cme.start_time, 0), xytext=(flare.start_time, 1),
-                    arrowprops=dict(arrowstyle='->', color='gray', alpha=0.3, linewidth=1))
+    # Draw connections for linked events, all as one collection
+    if linked_pairs:
+        ax1.add_collection(LineCollection(_link_segments(linked_pairs, 1, 0),
+                                          colors='gray', alpha=0.3, linewidths=1, zorder=1))
 
     ax1.set_yticks([0, 1])
     ax1.set_yticklabels(['CME', 'Flare'])
     ax1.set_xlabel('Date')
     ax1.set_title(f'Event Timeline (showing {len(linked_pairs)} linked pairs)')
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-    ax1.tick_params(axis='x', rotation=45)
+    _concise_dates(ax1)
     ax1.legend(loc='upper right')
     ax1.grid(True, axis='x', alpha=0.3)
 
     # 2. Daily count comparison
     ax2 = axes[0, 1]
-    flr_dates = Counter([t.date() for t in flr_times])
-    cme_dates = Counter([t.date() for t in cme_times])
-    all_dates = sorted(set(flr_dates.keys()) | set(cme_dates.keys()))
+    flr_days, flr_counts = _daily_counts(_utc_datetime64(flr_times))
+    cme_days, cme_counts = _daily_counts(_utc_datetime64(cme_times))
+    all_dates = np.union1d(flr_days, cme_days)
 
-    x = np.arange(len(all_dates))
+    # Bars sit at their dates; widths are in days
+    x = mdates.date2num(all_dates)
     width = 0.35
 
-    ax2.bar(x - width/2, [flr_dates.get(d, 0) for d in all_dates], width,
+    ax2.xaxis_date()
+    ax2.bar(x - width/2, _counts_on(all_dates, flr_days, flr_counts), width,
            label='Solar Flares', color=flr_color, alpha=0.8)
-    ax2.bar(x + width/2, [cme_dates.get(d, 0) for d in all_dates], width,
+    ax2.bar(x + width/2, _counts_on(all_dates, cme_days, cme_counts), width,
            label='CMEs', color=cme_color, alpha=0.8)
 
     ax2.set_xlabel('Date')
     ax2.set_ylabel('Count')
     ax2.set_title('Daily Event Counts')
-    ax2.set_xticks(x[::3])
-    ax2.set_xticklabels([d.strftime('%m-%d') for d in all_dates][::3], rotation=45)
+    _concise_dates(ax2)
     ax2.legend()
     ax2.grid(True, axis='y', alpha=0.3)
 
@@ -722,18 +1197,17 @@ def create_pairwise_flr_cme(flares: list[SpaceEvent], cmes: list[SpaceEvent], sa
                 cme_speeds.append(speed)
 
         if flare_intensities and cme_speeds:
-            ax3.scatter(flare_intensities, cme_speeds, c='purple', s=100, alpha=0.7, edgecolors='white')
+            ax3.plot(flare_intensities, cme_speeds, 'o', color='purple', markersize=10, alpha=0.7,
+                     markeredgecolor='white', linestyle='None')
             ax3.set_xlabel('Flare Intensity')
             ax3.set_ylabel('CME Speed (km/s)')
             ax3.set_title('Flare Intensity vs Associated CME Speed')
             ax3.grid(True, alpha=0.3)
 
             # Add trend line if enough points
-            if len(flare_intensities) > 2:
-                z = np.polyfit(flare_intensities, cme_speeds, 1)
-                p = np.poly1d(z)
-                x_line = np.linspace(min(flare_intensities), max(flare_intensities), 100)
-                ax3.plot(x_line, p(x_line), 'r--', alpha=0.5, label='Trend')
+            trend = _trend_line(flare_intensities, cme_speeds) if len(flare_intensities) > 2 else None
+            if trend is not None:
+                ax3.plot(*trend, 'r--', alpha=0.5, label='Trend')
                 ax3.legend()
     else:
         ax3.text(0.5, 0.5, 'No linked FLR-CME pairs found', transform=ax3.transAxes,
@@ -743,16 +1217,14 @@ def create_pairwise_flr_cme(flares: list[SpaceEvent], cmes: list[SpaceEvent], sa
     # 4. Time delay distribution for linked events
     ax4 = axes[1, 1]
     if linked_pairs:
-        delays = []
-        for flare, cme in linked_pairs:
-            delay = (cme.start_time - flare.start_time).total_seconds() / 3600
-            if delay > 0:
-                delays.append(delay)
-
-        if delays:
-            ax4.hist(delays, bins=15, color='purple', alpha=0.8, edgecolor='white')
-            ax4.axvline(x=np.median(delays), color='red', linestyle='--',
-                       label=f'Median: {np.median(delays):.1f}h')
+        delays = _link_hours(linked_pairs)
+        delays = delays[delays > 0]
+
+        if len(delays):
+            _hist_bars(ax4, delays, bins=15, color='purple', alpha=0.8, edgecolor='white')
+            median_delay = np.median(delays)
+            ax4.axvline(x=median_delay, color='red', linestyle='--',
+                       label=f'Median: {median_delay:.1f}h')
             ax4.set_xlabel('Time Delay (hours)')
             ax4.set_ylabel('Count')
             ax4.set_title('Flare-to-CME Time Delay')
@@ -763,68 +1235,79 @@ def create_pairwise_flr_cme(flares: list[SpaceEvent], cmes: list[SpaceEvent], sa
                 ha='center', va='center', fontsize=12)
         ax4.set_title('Flare-to-CME Time Delay')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"FLR-CME pairwise chart saved to: {save_path}")
 
-    plt.show()
+    _show()
     return fig
 
 
-def create_pairwise_cme_gst(cmes: list[SpaceEvent], storms: list[SpaceEvent], save_path: str = None):
-    """Create pairwise comparison chart for CMEs and Geomagnetic Storms."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    fig.suptitle('Coronal Mass Ejections vs Geomagnetic Storms', fontsize=14, fontweight='bold')
+def create_pairwise_cme_gst(cmes: list[SpaceEvent], storms: list[SpaceEvent], save_path: str = None,
+                            event_index: Optional[dict[str, SpaceEvent]] = None,
+                            linked_pairs: Optional[list[tuple[SpaceEvent, SpaceEvent]]] = None):
+    """
+    Create pairwise comparison chart for CMEs and Geomagnetic Storms.
 
-    cme_color = '#4ECDC4'
-    gst_color = '#9B59B6'
+    `linked_pairs` are the (cme, storm) pairs, e.g. EventSet.cme_gst_pairs.
+    When not supplied they are found through `event_index`, which maps event
+    IDs to events and is in turn built from the given lists if missing.
+    """
+    import numpy as np
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
+
+    fig, axes = _subplots(2, 2, figsize=(14, 10))
+    fig.suptitle('Coronal Mass Ejections vs Geomagnetic Storms', fontsize=14, fontweight='bold')
 
-    # Build lookup for linked events
-    all_events = {e.event_id: e for e in cmes + storms}
+    cme_color = EVENT_COLORS[EventType.CME]
+    gst_color = EVENT_COLORS[EventType.GST]
 
     # Find linked CME-GST pairs
-    linked_pairs = []
-    for cme in cmes:
-        for linked_id in cme.linked_events:
-            if linked_id in all_events and all_events[linked_id].event_type == 'GST':
-                gst = all_events[linked_id]
-                linked_pairs.append((cme, gst))
+    if linked_pairs is None:
+        all_events = event_index if event_index is not None else build_event_index(cmes, storms)
+        linked_pairs = find_linked_pairs(cmes, EventType.GST, all_events)
 
     # 1. Dual timeline showing propagation
     ax1 = axes[0, 0]
     cme_times = [c.start_time for c in cmes]
     gst_times = [s.start_time for s in storms]
 
-    ax1.scatter(cme_times, [1]*len(cme_times), c=cme_color, s=60, alpha=0.7, label='CMEs', edgecolors='white')
-    ax1.scatter(gst_times, [0]*len(gst_times), c=gst_color, s=100, alpha=0.8, label='Geomagnetic Storms', edgecolors='white')
+    ax1.xaxis_date()
+    ax1.plot(mdates.date2num(cme_times), np.ones(len(cme_times)), 'o', color=cme_color, markersize=8, alpha=0.7,
+             markeredgecolor='white', linestyle='None', label='CMEs')
+    ax1.plot(mdates.date2num(gst_times), np.zeros(len(gst_times)), 'o', color=gst_color, markersize=10, alpha=0.8,
+             markeredgecolor='white', linestyle='None', label='Geomagnetic Storms')
 
-    # Draw propagation arrows
-    for cme, gst in linked_pairs:
-        ax1.annotate('', xy=(gst.start_time, 0), xytext=(cme.start_time, 1),
-                    arrowprops=dict(arrowstyle='->', color='gray', alpha=0.5, linewidth=2))
+    # Draw propagation lines, all as one collection
+    if linked_pairs:
+        ax1.add_collection(LineCollection(_link_segments(linked_pairs, 1, 0),
+                                          colors='gray', alpha=0.5, linewidths=2, zorder=1))
 
     ax1.set_yticks([0, 1])
     ax1.set_yticklabels(['Earth Impact\n(GST)', 'Solar Corona\n(CME)'])
     ax1.set_xlabel('Date')
     ax1.set_title(f'CME-to-Earth Propagation ({len(linked_pairs)} linked events)')
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-    ax1.tick_params(axis='x', rotation=45)
+    _concise_dates(ax1)
     ax1.legend(loc='upper right')
     ax1.grid(True, axis='x', alpha=0.3)
 
+    # Per-pair values for panels 2-4, parsed once
+    speeds = np.fromiter((parse_cme_speed(cme.intensity) for cme, _ in linked_pairs),
+                         dtype=np.float64, count=len(linked_pairs))
+    kps = np.fromiter((parse_kp_index(gst.intensity) for _, gst in linked_pairs),
+                      dtype=np.float64, count=len(linked_pairs))
+    hours = _link_hours(linked_pairs)
+
     # 2. Travel time distribution
     ax2 = axes[0, 1]
     if linked_pairs:
-        travel_times = []
-        for cme, gst in linked_pairs:
-            hours = (gst.start_time - cme.start_time).total_seconds() / 3600
-            if hours > 0:
-                travel_times.append(hours)
-
-        if travel_times:
-            ax2.hist(travel_times, bins=15, color='purple', alpha=0.8, edgecolor='white')
+        travel_times = hours[hours > 0]
+
+        if len(travel_times):
+            _hist_bars(ax2, travel_times, bins=15, color='purple', alpha=0.8, edgecolor='white')
             avg_time = np.mean(travel_times)
             ax2.axvline(x=avg_time, color='red', linestyle='--',
                        label=f'Mean: {avg_time:.1f}h ({avg_time/24:.1f} days)')
@@ -841,17 +1324,11 @@ def create_pairwise_cme_gst(cmes: list[SpaceEvent], storms: list[SpaceEvent], sa
     # 3. CME speed vs Storm Kp index
     ax3 = axes[1, 0]
     if linked_pairs:
-        speeds = []
-        kp_values = []
-        for cme, gst in linked_pairs:
-            speed = parse_cme_speed(cme.intensity)
-            kp = parse_kp_index(gst.intensity)
-            if speed > 0 and kp > 0:
-                speeds.append(speed)
-                kp_values.append(kp)
+        valid = (speeds > 0) & (kps > 0)
 
-        if speeds and kp_values:
-            ax3.scatter(speeds, kp_values, c='purple', s=100, alpha=0.7, edgecolors='white')
+        if valid.any():
+            ax3.plot(speeds[valid], kps[valid], 'o', color='purple', markersize=10, alpha=0.7,
+                     markeredgecolor='white', linestyle='None')
             ax3.set_xlabel('CME Speed (km/s)')
             ax3.set_ylabel('Storm Kp Index')
             ax3.set_title('CME Speed vs Resulting Storm Intensity')
@@ -869,103 +1346,102 @@ def create_pairwise_cme_gst(cmes: list[SpaceEvent], storms: list[SpaceEvent], sa
     # 4. CME speed vs travel time
     ax4 = axes[1, 1]
     if linked_pairs:
-        speeds = []
-        travel_times = []
-        for cme, gst in linked_pairs:
-            speed = parse_cme_speed(cme.intensity)
-            hours = (gst.start_time - cme.start_time).total_seconds() / 3600
-            if speed > 0 and hours > 0:
-                speeds.append(speed)
-                travel_times.append(hours)
+        valid = (speeds > 0) & (hours > 0)
+        valid_speeds, travel_times = speeds[valid], hours[valid]
 
-        if speeds and travel_times:
-            ax4.scatter(speeds, travel_times, c='purple', s=100, alpha=0.7, edgecolors='white')
+        if len(valid_speeds):
+            ax4.plot(valid_speeds, travel_times, 'o', color='purple', markersize=10, alpha=0.7,
+                     markeredgecolor='white', linestyle='None')
             ax4.set_xlabel('CME Speed (km/s)')
             ax4.set_ylabel('Travel Time (hours)')
             ax4.set_title('CME Speed vs Travel Time to Earth')
             ax4.grid(True, alpha=0.3)
 
             # Faster CMEs should arrive sooner - add trend if enough points
-            if len(speeds) > 2:
-                z = np.polyfit(speeds, travel_times, 1)
-                p = np.poly1d(z)
-                x_line = np.linspace(min(speeds), max(speeds), 100)
-                ax4.plot(x_line, p(x_line), 'r--', alpha=0.5, label='Trend')
+            trend = _trend_line(valid_speeds, travel_times) if len(valid_speeds) > 2 else None
+            if trend is not None:
+                ax4.plot(*trend, 'r--', alpha=0.5, label='Trend')
                 ax4.legend()
     else:
         ax4.text(0.5, 0.5, 'No linked CME-GST pairs found', transform=ax4.transAxes,
                 ha='center', va='center', fontsize=12)
         ax4.set_title('CME Speed vs Travel Time to Earth')
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"CME-GST pairwise chart saved to: {save_path}")
 
-    plt.show()
+    _show()
     return fig
 
 
 def create_pairwise_flr_gst(flares: list[SpaceEvent], storms: list[SpaceEvent],
-                            cmes: list[SpaceEvent], save_path: str = None):
-    """Create pairwise comparison chart for Solar Flares and Geomagnetic Storms."""
-    fig, axes = plt.subplots(2, 2, figsize=(14, 10))
+                            cmes: list[SpaceEvent], save_path: str = None,
+                            event_index: Optional[dict[str, SpaceEvent]] = None,
+                            chains: Optional[list[tuple[SpaceEvent, SpaceEvent, SpaceEvent]]] = None):
+    """
+    Create pairwise comparison chart for Solar Flares and Geomagnetic Storms.
+
+    `chains` are the (flare, cme, storm) chains, e.g. EventSet.chains. When
+    not supplied they are found through `event_index`, which maps event IDs
+    to events and is in turn built from the given lists if missing.
+    """
+    import numpy as np
+    import matplotlib.dates as mdates
+    from matplotlib.collections import LineCollection
+
+    fig, axes = _subplots(2, 2, figsize=(14, 10))
     fig.suptitle('Solar Flares vs Geomagnetic Storms (Full Sun-to-Earth)', fontsize=14, fontweight='bold')
 
-    flr_color = '#FF6B6B'
-    gst_color = '#9B59B6'
+    flr_color = EVENT_COLORS[EventType.FLR]
+    gst_color = EVENT_COLORS[EventType.GST]
 
     # Build event chains: FLR -> CME -> GST
-    all_events = {e.event_id: e for e in flares + cmes + storms}
-
-    # Find full chain events
-    full_chains = []  # (flare, cme, storm)
-    for flare in flares:
-        for cme_id in flare.linked_events:
-            if cme_id in all_events and all_events[cme_id].event_type == 'CME':
-                cme = all_events[cme_id]
-                for gst_id in cme.linked_events:
-                    if gst_id in all_events and all_events[gst_id].event_type == 'GST':
-                        gst = all_events[gst_id]
-                        full_chains.append((flare, cme, gst))
+    full_chains = chains  # (flare, cme, storm)
+    if full_chains is None:
+        all_events = event_index if event_index is not None else build_event_index(flares, cmes, storms)
+        full_chains = find_event_chains(find_linked_pairs(flares, EventType.CME, all_events), all_events)
 
     # 1. Full propagation timeline
     ax1 = axes[0, 0]
     flr_times = [f.start_time for f in flares]
     gst_times = [s.start_time for s in storms]
 
-    ax1.scatter(flr_times, [1]*len(flr_times), c=flr_color, s=60, alpha=0.7,
-               label='Solar Flares', edgecolors='white')
-    ax1.scatter(gst_times, [0]*len(gst_times), c=gst_color, s=100, alpha=0.8,
-               label='Geomagnetic Storms', edgecolors='white')
+    ax1.xaxis_date()
+    ax1.plot(mdates.date2num(flr_times), np.ones(len(flr_times)), 'o', color=flr_color, markersize=8, alpha=0.7,
+             markeredgecolor='white', linestyle='None', label='Solar Flares')
+    ax1.plot(mdates.date2num(gst_times), np.zeros(len(gst_times)), 'o', color=gst_color, markersize=10, alpha=0.8,
+             markeredgecolor='white', linestyle='None', label='Geomagnetic Storms')
 
-    # Draw full chain connections
-    for flare, cme, gst in full_chains:
-        total_time = (gst.start_time - flare.start_time).total_seconds() / 3600
-        ax1.annotate('', xy=(gst.start_time, 0), xytext=(flare.start_time, 1),
-                    arrowprops=dict(arrowstyle='->', color='orange', alpha=0.6, linewidth=2))
+    # Draw full chain connections, all as one collection
+    if full_chains:
+        ax1.add_collection(LineCollection(_link_segments(full_chains, 1, 0),
+                                          colors='orange', alpha=0.6, linewidths=2, zorder=1))
 
     ax1.set_yticks([0, 1])
     ax1.set_yticklabels(['Earth Impact', 'Sun Surface'])
     ax1.set_xlabel('Date')
     ax1.set_title(f'Sun-to-Earth Event Chain ({len(full_chains)} complete chains)')
-    ax1.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d'))
-    ax1.tick_params(axis='x', rotation=45)
+    _concise_dates(ax1)
     ax1.legend(loc='upper right')
     ax1.grid(True, axis='x', alpha=0.3)
 
+    # Per-chain values for panels 2-3, parsed once
+    hours = _link_hours(full_chains)
+    flare_vals = np.fromiter((parse_flare_class(flare.intensity)[1] for flare, _, _ in full_chains),
+                             dtype=np.float64, count=len(full_chains))
+    kps = np.fromiter((parse_kp_index(gst.intensity) for _, _, gst in full_chains),
+                      dtype=np.float64, count=len(full_chains))
+
     # 2. Total propagation time
     ax2 = axes[0, 1]
     if full_chains:
-        total_times = []
-        for flare, cme, gst in full_chains:
-            hours = (gst.start_time - flare.start_time).total_seconds() / 3600
-            if hours > 0:
-                total_times.append(hours)
-
-        if total_times:
-            ax2.hist(total_times, bins=15, color='orange', alpha=0.8, edgecolor='white')
+        total_times = hours[hours > 0]
+
+        if len(total_times):
+            _hist_bars(ax2, total_times, bins=15, color='orange', alpha=0.8, edgecolor='white')
             avg = np.mean(total_times)
             ax2.axvline(x=avg, color='red', linestyle='--',
                        label=f'Mean: {avg:.1f}h ({avg/24:.1f} days)')
@@ -982,17 +1458,11 @@ def create_pairwise_flr_gst(flares: list[SpaceEvent], storms: list[SpaceEvent],
     # 3. Flare intensity vs storm Kp
     ax3 = axes[1, 0]
     if full_chains:
-        flare_vals = []
-        kp_vals = []
-        for flare, cme, gst in full_chains:
-            _, intensity = parse_flare_class(flare.intensity)
-            kp = parse_kp_index(gst.intensity)
-            if intensity > 0 and kp > 0:
-                flare_vals.append(intensity)
-                kp_vals.append(kp)
+        valid = (flare_vals > 0) & (kps > 0)
 
-        if flare_vals and kp_vals:
-            ax3.scatter(flare_vals, kp_vals, c='orange', s=100, alpha=0.7, edgecolors='white')
+        if valid.any():
+            ax3.plot(flare_vals[valid], kps[valid], 'o', color='orange', markersize=10, alpha=0.7,
+                     markeredgecolor='white', linestyle='None')
             ax3.set_xlabel('Flare Intensity')
             ax3.set_ylabel('Storm Kp Index')
             ax3.set_title('Initial Flare vs Final Storm Intensity')
@@ -1004,86 +1474,129 @@ def create_pairwise_flr_gst(flares: list[SpaceEvent], storms: list[SpaceEvent],
 
     # 4. Event correlation heatmap by day
     ax4 = axes[1, 1]
-    flr_dates = Counter([t.date() for t in flr_times])
-    gst_dates = Counter([t.date() for t in gst_times])
+    flr_days, flr_counts = _daily_counts(_utc_datetime64(flr_times))
+    gst_days, gst_counts = _daily_counts(_utc_datetime64(gst_times))
+    all_dates = np.union1d(flr_days, gst_days)
 
-    all_dates = sorted(set(flr_dates.keys()) | set(gst_dates.keys()))
-
-    if all_dates:
+    if len(all_dates):
         # Create simple overlay bar chart
-        x = np.arange(len(all_dates))
+        x = mdates.date2num(all_dates)
         width = 0.35
 
-        ax4.bar(x - width/2, [flr_dates.get(d, 0) for d in all_dates], width,
+        ax4.xaxis_date()
+        ax4.bar(x - width/2, _counts_on(all_dates, flr_days, flr_counts), width,
                label='Solar Flares', color=flr_color, alpha=0.8)
-        ax4.bar(x + width/2, [gst_dates.get(d, 0) * 5 for d in all_dates], width,  # Scale GST for visibility
+        ax4.bar(x + width/2, _counts_on(all_dates, gst_days, gst_counts) * 5, width,  # Scale GST for visibility
                label='Geomagnetic Storms (×5)', color=gst_color, alpha=0.8)
 
         ax4.set_xlabel('Date')
         ax4.set_ylabel('Count')
         ax4.set_title('Daily Solar Activity vs Earth Impact')
-        ax4.set_xticks(x[::3])
-        ax4.set_xticklabels([d.strftime('%m-%d') for d in all_dates][::3], rotation=45)
+        _concise_dates(ax4)
         ax4.legend()
         ax4.grid(True, axis='y', alpha=0.3)
 
-    plt.tight_layout()
+    fig.tight_layout()
 
     if save_path:
-        plt.savefig(save_path, dpi=150, bbox_inches='tight')
+        fig.savefig(save_path, dpi=150, bbox_inches='tight')
         print(f"FLR-GST pairwise chart saved to: {save_path}")
 
-    plt.show()
+    _show()
     return fig
 
 
 def print_event_summary(flares: list[SpaceEvent],
                         cmes: list[SpaceEvent],
-                        storms: list[SpaceEvent]):
-    """Print a summary of fetched events."""
+                        storms: list[SpaceEvent],
+                        event_index: Optional[dict[str, SpaceEvent]] = None,
+                        linked_pairs: Optional[list[tuple[SpaceEvent, SpaceEvent]]] = None):
+    """Print a summary of fetched events.
+
+    `linked_pairs` are the (cme, storm) pairs, e.g. EventSet.cme_gst_pairs.
+    """
     print("\n" + "="*60)
     print("SPACE WEATHER EVENT SUMMARY")
     print("="*60)
 
     print(f"\n🌟 Solar Flares (FLR): {len(flares)} events")
-    for flare in sorted(flares, key=lambda x: x.start_time)[:5]:
+    for flare in heapq.nsmallest(5, flares, key=_start_time):
         print(f"   • {flare.start_time.strftime('%Y-%m-%d %H:%M')} - Class {flare.intensity}")
     if len(flares) > 5:
         print(f"   ... and {len(flares) - 5} more")
 
     print(f"\n💨 Coronal Mass Ejections (CME): {len(cmes)} events")
-    for cme in sorted(cmes, key=lambda x: x.start_time)[:5]:
+    for cme in heapq.nsmallest(5, cmes, key=_start_time):
         print(f"   • {cme.start_time.strftime('%Y-%m-%d %H:%M')} - {cme.intensity}")
     if len(cmes) > 5:
         print(f"   ... and {len(cmes) - 5} more")
 
     print(f"\n🌍 Geomagnetic Storms (GST): {len(storms)} events")
-    for storm in sorted(storms, key=lambda x: x.start_time)[:5]:
+    for storm in heapq.nsmallest(5, storms, key=_start_time):
         print(f"   • {storm.start_time.strftime('%Y-%m-%d %H:%M')} - {storm.intensity}")
     if len(storms) > 5:
         print(f"   ... and {len(storms) - 5} more")
 
     # Calculate average propagation time for linked events
-    travel_times = []
-    all_events = {e.event_id: e for e in flares + cmes + storms}
-
-    for event in cmes:
-        for linked_id in event.linked_events:
-            if linked_id in all_events:
-                linked = all_events[linked_id]
-                if linked.event_type == "GST":
-                    delta = linked.start_time - event.start_time
-                    travel_times.append(delta.total_seconds() / 3600)
-
-    if travel_times:
-        avg_time = sum(travel_times) / len(travel_times)
+    if linked_pairs is None:
+        all_events = event_index if event_index is not None else build_event_index(flares, cmes, storms)
+        linked_pairs = find_linked_pairs(cmes, EventType.GST, all_events)
+    if linked_pairs:
+        avg_time = _link_hours(linked_pairs).mean()
         print(f"\n⏱️  Average CME to Earth travel time: {avg_time:.1f} hours ({avg_time/24:.1f} days)")
 
     print("\n" + "="*60)
 
 
-def main():
+def _init_chart_worker():
+    """Process pool initializer: workers only ever save charts."""
+    global _HEADLESS
+    _HEADLESS = True
+    _configure_matplotlib()
+
+
+def _render_chart(func, args, kwargs):
+    """Run one chart function in a worker, discarding the unpicklable figure."""
+    func(*args, **kwargs)
+
+
+def generate_charts(charts: list[tuple], max_workers: int = 1):
+    """Render (label, func, args, kwargs) chart jobs.
+
+    With max_workers > 1, headless runs render the charts in parallel worker
+    processes, since each one is independent CPU-bound Agg work. Interactive
+    runs stay serial so every window is shown from this process.
+    """
+    if not _HEADLESS or len(charts) < 2 or max_workers < 2:
+        for i, (label, func, args, kwargs) in enumerate(charts, 1):
+            print(f"\n{i}. {label}")
+            func(*args, **kwargs)
+        return
+
+    # spawn avoids forking a process that holds live HTTP sessions and threads
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(charts)),
+                             mp_context=multiprocessing.get_context("spawn"),
+                             initializer=_init_chart_worker) as pool:
+        futures = {pool.submit(_render_chart, func, args, kwargs): (i, label)
+                   for i, (label, func, args, kwargs) in enumerate(charts, 1)}
+        for future in as_completed(futures):
+            future.result()
+            i, label = futures[future]
+            print(f"{i}. {label} done")
+
+
+def main(argv: Optional[list[str]] = None):
     """Main function to fetch data and create visualization."""
+    global _HEADLESS
+
+    parser = argparse.ArgumentParser(description="Plot NASA DONKI space weather events")
+    parser.add_argument("--headless", action="store_true",
+                        help="Only save the charts; render with Agg and don't open windows")
+    args = parser.parse_args(argv)
+    if args.headless:
+        _HEADLESS = True
+    _configure_matplotlib()
+
     # Date range for data (default: last 30 days)
     end_date = datetime.now()
     start_date = end_date - timedelta(days=30)
@@ -1097,59 +1610,62 @@ def main():
 
     try:
         # Fetch all event types
-        print("Fetching Solar Flares (FLR)...")
-        flares = fetch_solar_flares(start_str, end_str)
-        print(f"  Found {len(flares)} solar flares")
+        print("Fetching Solar Flares (FLR), Coronal Mass Ejections (CME) "
+              "and Geomagnetic Storms (GST)...")
+        flares, cmes, storms = fetch_all(start_str, end_str)
 
-        print("Fetching Coronal Mass Ejections (CME)...")
-        cmes = fetch_cme(start_str, end_str)
+        print(f"  Found {len(flares)} solar flares")
         print(f"  Found {len(cmes)} CMEs")
-
-        print("Fetching Geomagnetic Storms (GST)...")
-        storms = fetch_geomagnetic_storms(start_str, end_str)
         print(f"  Found {len(storms)} geomagnetic storms")
 
+        # Shared ID lookup and linked pairs, built once for all charts
+        events = EventSet(flares, cmes, storms)
+        event_index = events.by_id
+
         # Print summary
-        print_event_summary(flares, cmes, storms)
+        print_event_summary(flares, cmes, storms, event_index=event_index,
+                            linked_pairs=events.cme_gst_pairs)
 
         # Create visualizations
         if flares or cmes or storms:
             print("\nGenerating charts...")
 
-            # Main timeline
-            print("\n1. Combined Timeline Chart")
+            # Each chart is independent; collect them as (label, func, args, kwargs)
             title = f"Space Weather Events: {start_str} to {end_str}"
-            create_timeline_chart(
-                flares, cmes, storms,
-                title=title,
-                save_path="space_weather_timeline.png"
-            )
+            charts = [("Combined Timeline Chart", create_timeline_chart, (flares, cmes, storms),
+                       dict(title=title, save_path="space_weather_timeline.png",
+                            event_index=event_index))]
 
             # Individual charts
             if flares:
-                print("\n2. Solar Flare Analysis")
-                create_flare_chart(flares, save_path="chart_flares.png")
-
+                charts.append(("Solar Flare Analysis", create_flare_chart, (flares,),
+                               dict(save_path="chart_flares.png")))
             if cmes:
-                print("\n3. CME Analysis")
-                create_cme_chart(cmes, save_path="chart_cme.png")
-
+                charts.append(("CME Analysis", create_cme_chart, (cmes,),
+                               dict(save_path="chart_cme.png")))
             if storms:
-                print("\n4. Geomagnetic Storm Analysis")
-                create_gst_chart(storms, save_path="chart_gst.png")
+                charts.append(("Geomagnetic Storm Analysis", create_gst_chart, (storms,),
+                               dict(save_path="chart_gst.png")))
 
             # Pairwise charts
             if flares and cmes:
-                print("\n5. Flares vs CMEs Comparison")
-                create_pairwise_flr_cme(flares, cmes, save_path="chart_flr_vs_cme.png")
-
+                charts.append(("Flares vs CMEs Comparison", create_pairwise_flr_cme, (flares, cmes),
+                               dict(save_path="chart_flr_vs_cme.png",
+                                    linked_pairs=events.flr_cme_pairs)))
             if cmes and storms:
-                print("\n6. CMEs vs Geomagnetic Storms Comparison")
-                create_pairwise_cme_gst(cmes, storms, save_path="chart_cme_vs_gst.png")
-
+                charts.append(("CMEs vs Geomagnetic Storms Comparison", create_pairwise_cme_gst,
+                               (cmes, storms),
+                               dict(save_path="chart_cme_vs_gst.png",
+                                    linked_pairs=events.cme_gst_pairs)))
             if flares and storms:
-                print("\n7. Flares vs Geomagnetic Storms (Full Chain)")
-                create_pairwise_flr_gst(flares, storms, cmes, save_path="chart_flr_vs_gst.png")
+                charts.append(("Flares vs Geomagnetic Storms (Full Chain)", create_pairwise_flr_gst,
+                               (flares, storms, cmes),
+                               dict(save_path="chart_flr_vs_gst.png", chains=events.chains)))
+
+            workers = 1
+            if len(flares) + len(cmes) + len(storms) >= PARALLEL_CHART_MIN_EVENTS:
+                workers = min(MAX_CHART_WORKERS, os.cpu_count() or 1)
+            generate_charts(charts, max_workers=workers)
 
             print("\n" + "="*60)
             print("All charts generated successfully!")
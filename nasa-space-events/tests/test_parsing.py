@@ -0,0 +1,24 @@
+from space_weather_timeline import _CLASS_VAL, parse_flare_class, parse_flare_classes
+
+
+def test_flare_classes_match_single_parser():
+    intensities = ["X1.5", "M2", "C3.4", "B", "", "unknown", "A9.9"]
+    pairs = parse_flare_classes(intensities)
+    assert len(pairs) == len(intensities)
+    for intensity, (letter, number) in zip(intensities, pairs):
+        expected = parse_flare_class(intensity)
+        if letter:
+            assert (letter, _CLASS_VAL[letter] * 10 + float(number)) == expected
+        else:
+            assert expected == ('Unknown', 0)
+
+
+def test_flare_classes_multiline_intensity():
+    intensities = ["M1.2", "X2.0\nC3.0", "C1.1\r\nB2", "B4.5"]
+    assert parse_flare_classes(intensities) == [
+        ("M", "1.2"), ("X", "2.0"), ("C", "1.1"), ("B", "4.5"),
+    ]
+
+
+def test_flare_classes_empty():
+    assert parse_flare_classes([]) == []
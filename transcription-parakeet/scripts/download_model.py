@@ -3,37 +3,65 @@
 Download and cache the Parakeet model
 """
 
+import argparse
 import sys
 
 try:
-    import nemo.collections.asr as nemo_asr
+    from huggingface_hub import snapshot_download
+    from nemo.utils.data_utils import resolve_cache_dir
 except ImportError:
     print("Error: NeMo toolkit not installed. Run: pip install nemo_toolkit[asr]")
     sys.exit(1)
 
 
-def download_model(model_name: str = "nvidia/parakeet-tdt-0.6b-v2"):
+def download_model(model_name: str = "nvidia/parakeet-tdt-0.6b-v2", verify: bool = False):
     """
     Download and cache the Parakeet model
 
+    Only the model files are fetched, into the HuggingFace hub cache inside
+    NeMo's cache directory where from_pretrained() looks for them; files
+    already cached are not downloaded again.
+
     Args:
         model_name: HuggingFace model name
+        verify: Also load the model with NeMo to check that it works
+
+    Returns:
+        True on success
     """
     print(f"Downloading model: {model_name}")
     print("This may take a few minutes on first run...")
 
     try:
-        # This will download and cache the model
-        asr_model = nemo_asr.models.ASRModel.from_pretrained(model_name=model_name)
+        local_dir = snapshot_download(repo_id=model_name,
+                                      cache_dir=resolve_cache_dir() / "hf_hub_cache")
         print(f"✓ Model downloaded and cached successfully!")
-        print(f"Model has {asr_model.num_weights / 1e6:.1f}M parameters")
-        return True
+        print(f"Cached at: {local_dir}")
     except Exception as e:
         print(f"Error downloading model: {str(e)}")
         return False
 
+    if verify:
+        import nemo.collections.asr as nemo_asr
+
+        try:
+            asr_model = nemo_asr.models.ASRModel.from_pretrained(model_name=model_name)
+            print("✓ Model loaded successfully!")
+            print(f"Model has {asr_model.num_weights / 1e6:.1f}M parameters")
+        except Exception as e:
+            print(f"Error loading model: {str(e)}")
+            return False
+
+    return True
+
 
 if __name__ == "__main__":
-    model_name = sys.argv[1] if len(sys.argv) > 1 else "nvidia/parakeet-tdt-0.6b-v2"
-    success = download_model(model_name)
+    parser = argparse.ArgumentParser(description="Download and cache the Parakeet model")
+    parser.add_argument("model", nargs="?", default="nvidia/parakeet-tdt-0.6b-v2",
+                        help="HuggingFace model name")
+    parser.add_argument("--verify", action="store_true",
+                        help="Also load the model with NeMo to check that it works")
+
+    args = parser.parse_args()
+    success = download_model(args.model, args.verify)
     sys.exit(0 if success else 1)
@@ -6,80 +6,234 @@ This script is called by the TypeScript wrapper to perform the actual transcript
 
 import argparse
 import json
+import os
 import sys
+from contextlib import nullcontext
 from pathlib import Path
 
 try:
+    import torch
     import nemo.collections.asr as nemo_asr
 except ImportError:
     print("Error: NeMo toolkit not installed. Run: pip install nemo_toolkit[asr]", file=sys.stderr)
     sys.exit(1)
 
 
-def transcribe_audio(audio_path: str, model_name: str = "nvidia/parakeet-tdt-0.6b-v2",
-                     include_timestamps: bool = False):
+def load_model(model_name: str = "nvidia/parakeet-tdt-0.6b-v2", compile_encoder: bool = False):
     """
-    Transcribe audio file using Parakeet model
+    Load the Parakeet model in inference mode
 
     Args:
-        audio_path: Path to audio file (.wav or .flac)
         model_name: HuggingFace model name or local path
-        include_timestamps: Whether to include word-level timestamps
+        compile_encoder: Compile the encoder with torch.compile; the first
+            transcriptions are slower while it compiles, so this pays off
+            when one process transcribes many files (--serve)
 
     Returns:
-        Dictionary with transcription results
+        The loaded NeMo ASR model
     """
-    # Load the model
     print(f"Loading model: {model_name}", file=sys.stderr)
     asr_model = nemo_asr.models.ASRModel.from_pretrained(model_name=model_name)
+    if torch.cuda.is_available():
+        asr_model = asr_model.cuda()
+    asr_model.eval()
+
+    if compile_encoder:
+        # Audio lengths vary per file, so avoid recompiling for every shape
+        asr_model.encoder = torch.compile(asr_model.encoder, dynamic=True)
+
+    return asr_model
+
+
+def autocast(precision: str = "auto"):
+    """
+    Mixed-precision context for inference
+
+    Args:
+        precision: "fp32", "bf16", "fp16", or "auto" for bf16 where the GPU
+            supports it, else fp16; always fp32 on CPU
+
+    Returns:
+        A context manager to run the model under
+    """
+    if precision == "fp32" or not torch.cuda.is_available():
+        return nullcontext()
+    if precision == "auto":
+        precision = "bf16" if torch.cuda.is_bf16_supported() else "fp16"
+    dtype = torch.bfloat16 if precision == "bf16" else torch.float16
+    return torch.autocast(device_type="cuda", dtype=dtype)
 
-    # Transcribe
-    print(f"Transcribing: {audio_path}", file=sys.stderr)
+
+def _format_hypothesis(hypothesis, include_timestamps: bool) -> dict:
+    """Convert one NeMo transcription hypothesis to the JSON result shape"""
+    result = {
+        "text": hypothesis.text
+    }
 
     if include_timestamps:
-        output = asr_model.transcribe([audio_path], timestamps=True)
-        result = {
-            "text": output[0].text,
-            "timestamps": []
-        }
+        result["timestamps"] = []
 
         # Extract word timestamps if available
-        if hasattr(output[0], 'timestamp') and 'word' in output[0].timestamp:
-            word_timestamps = output[0].timestamp['word']
+        if hasattr(hypothesis, 'timestamp') and 'word' in hypothesis.timestamp:
+            word_timestamps = hypothesis.timestamp['word']
             for word_info in word_timestamps:
                 result["timestamps"].append({
                     "word": word_info[0],
                     "start": word_info[1],
                     "end": word_info[2]
                 })
-    else:
-        output = asr_model.transcribe([audio_path])
-        result = {
-            "text": output[0].text
-        }
 
     return result
 
 
+def transcribe_files(audio_paths: list[str], model_name: str = "nvidia/parakeet-tdt-0.6b-v2",
+                     include_timestamps: bool = False, asr_model=None, precision: str = "auto",
+                     batch_size: int = 8):
+    """
+    Transcribe several audio files in batches using Parakeet model
+
+    Args:
+        audio_paths: Paths to audio files (.wav or .flac)
+        model_name: HuggingFace model name or local path
+        include_timestamps: Whether to include word-level timestamps
+        asr_model: Already loaded model to reuse; loaded from model_name if omitted
+        precision: Inference precision, see autocast()
+        batch_size: Number of files NeMo pads into one batch on the device
+
+    Returns:
+        List of transcription result dictionaries, in input order
+    """
+    if asr_model is None:
+        asr_model = load_model(model_name)
+
+    # Transcribe
+    for audio_path in audio_paths:
+        print(f"Transcribing: {audio_path}", file=sys.stderr)
+
+    with torch.inference_mode(), autocast(precision):
+        if include_timestamps:
+            output = asr_model.transcribe(audio_paths, batch_size=batch_size, timestamps=True)
+        else:
+            output = asr_model.transcribe(audio_paths, batch_size=batch_size)
+
+    return [_format_hypothesis(hypothesis, include_timestamps) for hypothesis in output]
+
+
+def transcribe_audio(audio_path: str, model_name: str = "nvidia/parakeet-tdt-0.6b-v2",
+                     include_timestamps: bool = False, asr_model=None, precision: str = "auto"):
+    """
+    Transcribe audio file using Parakeet model
+
+    Args:
+        audio_path: Path to audio file (.wav or .flac)
+        model_name: HuggingFace model name or local path
+        include_timestamps: Whether to include word-level timestamps
+        asr_model: Already loaded model to reuse; loaded from model_name if omitted
+        precision: Inference precision, see autocast()
+
+    Returns:
+        Dictionary with transcription results
+    """
+    return transcribe_files([audio_path], model_name, include_timestamps, asr_model, precision)[0]
+
+
+def serve(model_name: str = "nvidia/parakeet-tdt-0.6b-v2", compile_encoder: bool = False,
+          precision: str = "auto"):
+    """
+    Load the model once, then answer transcription requests on stdin until it is closed
+
+    Each request is one JSON line, {"id": any, "audio": path, "timestamps": bool},
+    and is answered with one JSON line on stdout: the transcription result, or
+    {"error": message}, with the request's "id" echoed back. A {"ready": true}
+    line is written once the model is loaded.
+
+    Args:
+        model_name: HuggingFace model name or local path
+        compile_encoder: Compile the encoder, see load_model()
+        precision: Inference precision, see autocast()
+    """
+    # Keep a private handle on the real stdout for responses, then point fd 1
+    # at stderr: NeMo's log handlers, native code and stray prints all write
+    # to fd 1 and would otherwise interleave with the JSON lines
+    sys.stdout.flush()
+    out = os.fdopen(os.dup(sys.stdout.fileno()), "w")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    def respond(message: dict):
+        out.write(json.dumps(message) + "\n")
+        out.flush()
+
+    asr_model = load_model(model_name, compile_encoder)
+    respond({"ready": True})
+
+    for line in sys.stdin:
+        if not line.strip():
+            continue
+
+        request = {}
+        try:
+            request = json.loads(line)
+            audio_path = request["audio"]
+            if not Path(audio_path).exists():
+                raise FileNotFoundError(f"Audio file not found: {audio_path}")
+
+            result = transcribe_audio(audio_path, include_timestamps=bool(request.get("timestamps")),
+                                      asr_model=asr_model, precision=precision)
+        except Exception as e:
+            result = {"error": str(e)}
+
+        if isinstance(request, dict) and "id" in request:
+            result["id"] = request["id"]
+        respond(result)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Transcribe audio using Parakeet model")
-    parser.add_argument("--audio", required=True, help="Path to audio file")
+    parser.add_argument("--audio", nargs="+",
+                       help="Path to audio file; several files are transcribed as one batch")
     parser.add_argument("--model", default="nvidia/parakeet-tdt-0.6b-v2",
                        help="Model name or path")
     parser.add_argument("--timestamps", action="store_true",
                        help="Include word-level timestamps")
+    parser.add_argument("--serve", action="store_true",
+                       help="Load the model once and answer JSON-line requests on stdin")
+    parser.add_argument("--precision", choices=["auto", "bf16", "fp16", "fp32"], default="auto",
+                       help="GPU inference precision (auto: bf16 if supported, else fp16)")
+    parser.add_argument("--batch-size", type=int, default=8,
+                       help="Files per batch when several are given")
+    parser.add_argument("--compile", action="store_true",
+                       help="Compile the encoder with torch.compile (best with --serve)")
 
     args = parser.parse_args()
 
-    # Check if audio file exists
-    if not Path(args.audio).exists():
-        print(f"Error: Audio file not found: {args.audio}", file=sys.stderr)
-        sys.exit(1)
+    if args.serve:
+        try:
+            serve(args.model, args.compile, args.precision)
+        except Exception as e:
+            print(f"Error loading model: {str(e)}", file=sys.stderr)
+            sys.exit(1)
+        return
+
+    if not args.audio:
+        parser.error("--audio is required unless --serve is given")
+
+    # Check if audio files exist
+    for audio_path in args.audio:
+        if not Path(audio_path).exists():
+            print(f"Error: Audio file not found: {audio_path}", file=sys.stderr)
+            sys.exit(1)
 
     try:
-        result = transcribe_audio(args.audio, args.model, args.timestamps)
-        # Output JSON to stdout for the TypeScript wrapper to parse
-        print(json.dumps(result, indent=2))
+        results = transcribe_files(args.audio, include_timestamps=args.timestamps,
+                                   asr_model=load_model(args.model, args.compile),
+                                   precision=args.precision, batch_size=args.batch_size)
+        # Output JSON to stdout for the TypeScript wrapper to parse: a single
+        # result for one file, or a list of results tagged with their path
+        if len(args.audio) == 1:
+            print(json.dumps(results[0], indent=2))
+        else:
+            print(json.dumps([{"path": path, **result} for path, result in zip(args.audio, results)],
+                             indent=2))
     except Exception as e:
         print(f"Error during transcription: {str(e)}", file=sys.stderr)
         sys.exit(1)
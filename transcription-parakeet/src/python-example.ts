@@ -29,6 +29,10 @@ async function main() {
   const audioPath = process.argv[2] || resolve(process.cwd(), 'examples', 'sample.wav');
 
   try {
+    // Load the model once; both transcriptions below reuse it
+    console.log('Loading model...');
+    await transcriber.start();
+
     console.log(`Transcribing: ${audioPath}`);
     console.log('(This may take a moment...)\n');
 
@@ -61,7 +65,9 @@ async function main() {
 
   } catch (error) {
     console.error('Error during transcription:', error);
-    process.exit(1);
+    process.exitCode = 1;
+  } finally {
+    await transcriber.close();
   }
 }
 
@@ -5,14 +5,28 @@
  * providing a TypeScript-friendly interface while leveraging the official implementation.
  */
 
-import { spawn } from 'child_process';
+import { spawn, ChildProcessWithoutNullStreams } from 'child_process';
+import { createInterface } from 'readline';
 import { TranscriptionResult, TranscriptionOptions, ParakeetConfig } from './types.js';
 import { existsSync } from 'fs';
 import { resolve } from 'path';
 
+type ServerResponse = TranscriptionResult & { id?: number; ready?: boolean; error?: string };
+
+// Requests are numbered from 1; the server's untagged ready line resolves 0
+const READY_ID = 0;
+
+interface PendingResponse {
+  resolve: (response: ServerResponse) => void;
+  reject: (error: Error) => void;
+}
+
 export class PythonParakeetTranscriber {
   private config: ParakeetConfig;
   private pythonScriptPath: string;
+  private server: ChildProcessWithoutNullStreams | null = null;
+  private pending = new Map<number, PendingResponse>();
+  private lastRequestId = READY_ID;
 
   constructor(config: ParakeetConfig = {}) {
     this.config = config;
@@ -37,6 +51,94 @@ export class PythonParakeetTranscriber {
     });
   }
 
+  /**
+   * Start a persistent Python process that loads the model once.
+   * Later transcribe() calls reuse it instead of reloading the model,
+   * until close() is called.
+   */
+  async start(): Promise<void> {
+    if (this.server) {
+      return;
+    }
+
+    if (!existsSync(this.pythonScriptPath)) {
+      throw new Error(`Python script not found: ${this.pythonScriptPath}`);
+    }
+
+    const args = [this.pythonScriptPath, '--serve'];
+
+    if (this.config.modelPath) {
+      args.push('--model', this.config.modelPath);
+    }
+
+    const server = spawn('python3', args);
+    this.server = server;
+
+    let stderr = '';
+    server.stderr.on('data', (data) => {
+      // Keep only the tail; the server logs every file it transcribes
+      stderr = (stderr + data.toString()).slice(-4096);
+    });
+
+    // Each response is one JSON line carrying the id of its request
+    createInterface({ input: server.stdout }).on('line', (line) => {
+      let response: ServerResponse;
+      try {
+        response = JSON.parse(line);
+      } catch {
+        // Not a response, e.g. output printed before the server took over stdout
+        return;
+      }
+
+      const id = response.ready ? READY_ID : response.id;
+      const pending = id === undefined ? undefined : this.pending.get(id);
+      if (pending && id !== undefined) {
+        this.pending.delete(id);
+        pending.resolve(response);
+      }
+    });
+
+    const fail = (error: Error) => {
+      this.server = null;
+      for (const pending of this.pending.values()) {
+        pending.reject(error);
+      }
+      this.pending.clear();
+    };
+
+    server.on('close', (code) => {
+      fail(new Error(`Python process exited with code ${code}\nStderr: ${stderr}`));
+    });
+
+    server.on('error', (error) => {
+      fail(new Error(`Failed to spawn Python process: ${error.message}`));
+    });
+
+    // Wait for the model to load
+    await this.response(READY_ID);
+  }
+
+  /**
+   * Stop the persistent Python process started by start()
+   */
+  async close(): Promise<void> {
+    const server = this.server;
+    if (!server) {
+      return;
+    }
+
+    await new Promise<void>((resolve) => {
+      server.once('close', () => resolve());
+      server.stdin.end();
+    });
+  }
+
+  private response(id: number): Promise<ServerResponse> {
+    return new Promise((resolve, reject) => {
+      this.pending.set(id, { resolve, reject });
+    });
+  }
+
   /**
    * Transcribe an audio file using the Python NeMo implementation
    */
@@ -45,17 +147,40 @@ export class PythonParakeetTranscriber {
       throw new Error(`Audio file not found: ${options.audioPath}`);
     }
 
+    if (this.server) {
+      const id = ++this.lastRequestId;
+      const response = this.response(id);
+      this.server.stdin.write(JSON.stringify({
+        id,
+        audio: options.audioPath,
+        timestamps: options.includeTimestamps ?? false,
+      }) + '\n');
+
+      const { error, text, timestamps } = await response;
+      if (error) {
+        throw new Error(`Error during transcription: ${error}`);
+      }
+      return timestamps ? { text, timestamps } : { text };
+    }
+
+    return this.runScript<TranscriptionResult>([options.audioPath], options.includeTimestamps ?? false);
+  }
+
+  /**
+   * Run transcribe.py once over one or more files and parse its JSON output
+   */
+  private runScript<T>(audioPaths: string[], includeTimestamps: boolean): Promise<T> {
     if (!existsSync(this.pythonScriptPath)) {
-      throw new Error(`Python script not found: ${this.pythonScriptPath}`);
+      return Promise.reject(new Error(`Python script not found: ${this.pythonScriptPath}`));
     }
 
     return new Promise((resolve, reject) => {
       const args = [
         this.pythonScriptPath,
-        '--audio', options.audioPath,
+        '--audio', ...audioPaths,
       ];
 
-      if (options.includeTimestamps) {
+      if (includeTimestamps) {
         args.push('--timestamps');
       }
 
@@ -83,7 +208,7 @@ export class PythonParakeetTranscriber {
         }
 
         try {
-          const result: TranscriptionResult = JSON.parse(stdout);
+          const result: T = JSON.parse(stdout);
           resolve(result);
         } catch (error) {
           reject(new Error(`Failed to parse output: ${stdout}\nError: ${error}`));
@@ -100,13 +225,32 @@ export class PythonParakeetTranscriber {
    * Batch transcribe multiple audio files
    */
   async transcribeBatch(files: TranscriptionOptions[]): Promise<TranscriptionResult[]> {
-    const results: TranscriptionResult[] = [];
+    // A running server already has the model loaded
+    if (this.server || files.length < 2) {
+      const results: TranscriptionResult[] = [];
+
+      for (const file of files) {
+        const result = await this.transcribe(file);
+        results.push(result);
+      }
+
+      return results;
+    }
 
     for (const file of files) {
-      const result = await this.transcribe(file);
-      results.push(result);
+      if (!existsSync(file.audioPath)) {
+        throw new Error(`Audio file not found: ${file.audioPath}`);
+      }
     }
 
-    return results;
+    // One process loads the model once and transcribes the files in batches
+    const withTimestamps = files.some((file) => file.includeTimestamps);
+    const batch = await this.runScript<Array<TranscriptionResult & { path: string }>>(
+      files.map((file) => file.audioPath),
+      withTimestamps,
+    );
+
+    return batch.map(({ text, timestamps }, i) =>
+      files[i].includeTimestamps ? { text, timestamps } : { text });
   }
 }